@@ -1,29 +1,146 @@
+import asyncio
 import base64
 import datetime
+import importlib.util
+import json
 import os
 from datetime import time
-from typing import List, Dict, Optional, Any, Union
+from decimal import Decimal
+from functools import lru_cache
+from time import monotonic
+from typing import List, Dict, Optional, Any, Union, Type, Callable, Sequence, Tuple
 
 import requests
 from marshmallow import ValidationError, Schema
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from apc.schemas.dataclasses import Item, Address
 from apc.schemas.exceptions import ApiFieldException
+from apc.schemas.fast_dump import dump_order
+from apc.schemas.loaders import LOADERS
 from apc.schemas.models import Services
 from apc.schemas.schemas import (
     ServiceCheckSchema,
     CarrierSchema,
-    ExtendedFullOrderSchema,
     OrderOutputApiResponseSchema,
 )
-from apc.schemas.utilities import camel_to_snake, nested_lookup
+from apc.schemas.utilities import camel_to_snake
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - ujson is an optional speedup, used when orjson isn't available
+    ujson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional speedup
+    msgspec = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is only needed for the async api
+    httpx = None
+
+# The number of connections kept open to the API, and so the number of requests sent at once in batches
+_POOL_MAXSIZE = 10
+
+
+def _default(value: Any) -> Any:
+    """
+    Serialize the values the JSON encoder can't handle natively, matching the formats used by the schemas.
+    Args:
+        value (Any): The value to serialize.
+
+    Returns:
+        The JSON serializable representation of the value.
+
+    Raises:
+        TypeError: If the value is of an unsupported type.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%d/%m/%Y %H:%M")
+    if isinstance(value, datetime.date):
+        return value.strftime("%d/%m/%Y")
+    if isinstance(value, time):
+        return value.strftime("%H:%M")
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        # orjson serializes dates natively as ISO strings, pass them through to `_default` instead
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+else:  # pragma: no cover
+    # ujson has no hook matching `_default` on older releases, so it's only used to decode responses
+    _loads = ujson.loads if ujson is not None else json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_default).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _subtree_decoder(output_base: Tuple[str, ...]) -> "msgspec.json.Decoder":
+    """
+    Build a decoder that only materializes the value at `output_base` and the messages of the response.
+    Args:
+        output_base (Tuple[str, ...]): The path of keys to the part of the response to decode.
+
+    Returns:
+        msgspec.json.Decoder: The decoder, producing nested structs with one field per key in the path.
+    """
+    node_type = Any
+    for depth in range(len(output_base) - 1, -1, -1):
+        struct_fields = [(output_base[depth], Optional[node_type], None)]
+        if depth == 1:
+            # the status messages sit alongside the data, under the top level key
+            struct_fields.append(("Messages", Any, None))
+        node_type = msgspec.defstruct(f"_Level{depth}", struct_fields)
+    return msgspec.json.Decoder(node_type)
+
+
+# The keys of `Item.to_dict`, in order
+_ITEM_KEYS = ("weight", "type", "length", "width", "height", "value")
+
+
+# Schemas are stateless between dump/load calls, so one instance per class is shared by every request
+_SCHEMA_CACHE: Dict[Type[Schema], Schema] = {}
+
+
+def _schema(schema_cls: Type[Schema]) -> Schema:
+    """
+    Get the shared instance of a schema class, creating it on first use.
+    Args:
+        schema_cls (Type[Schema]): The schema class.
+
+    Returns:
+        Schema: The cached schema instance.
+    """
+    schema = _SCHEMA_CACHE.get(schema_cls)
+    if schema is None:
+        schema = _SCHEMA_CACHE.setdefault(schema_cls, schema_cls())
+    return schema
 
 
 class _BaseApi:
     base_url: str
     _username: str
     _password: str
+    _session: requests.Session
+    _auth_b64: str
+    _headers: Dict[str, str]
+    _methods: Dict[str, Callable[..., requests.Response]]
 
     def __init__(
         self, username: str, password: str, is_sandbox: Optional[bool] = False
@@ -36,6 +153,49 @@ class _BaseApi:
         self._password = password
         self._username = username
 
+        # A single session keeps connections to the API alive between calls instead of a new TCP/TLS handshake
+        # per request. Only idempotent requests are retried, so orders are never booked twice.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=_POOL_MAXSIZE,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ),
+        )
+
+        self._methods = {
+            "GET": self._session.get,
+            "POST": self._session.post,
+            "PUT": self._session.put,
+        }
+
+        # The credentials never change, so the headers are built once and sent with every request
+        self._auth_b64 = base64.b64encode(
+            f"{self._username}:{self._password}".encode("utf-8")
+        ).decode("utf-8")
+        self._headers = {
+            "Content-Type": "application/json",
+            "remote-user": f"Basic {self._auth_b64}",
+        }
+        self._session.headers.update(self._headers)
+
+    def close(self) -> None:
+        """Close the session, releasing its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "_BaseApi":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def validate(self):
         if self._password is None or not isinstance(self._password, str):
             raise ValueError("The password supplied does not appear valid.")
@@ -49,7 +209,7 @@ class _BaseApi:
         url_params: Optional[Dict[str, Any]] = None,
         body: Optional[Dict[str, Any]] = None,
         out_schema: Optional[Schema] = None,
-        output_base: Optional[List[str]] = None,
+        output_base: Optional[Sequence[str]] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         The main calling function to get from the APC Api.
@@ -60,26 +220,14 @@ class _BaseApi:
             url_params (Optional[Dict[str, Any]]): A dictionary of URL parameters.
             body (Optional[Dict[str, Any]]): A dictionary containing the body request.
             schema (Optional[Schema]): A schema to serialize the response from the API.
+            output_base (Optional[Sequence[str]]): The path of keys to the part of the response to deserialize.
 
         Returns:
             response (Union[Dict[str, Any], List[Dict[str, Any]]]): the api response
         """
         try:
-            # Determine the HTTP method to use+
-
-            # Base64 encode the username and password for the 'remote-user' header
-            auth_string = f"{self._username}:{self._password}"
-            auth_string_base64 = base64.b64encode(auth_string.encode("utf-8")).decode(
-                "utf-8"
-            )
-
-            # Create the headers dictionary
-            headers = {
-                "Content-Type": "application/json",
-                "remote-user": f"Basic {auth_string_base64}",
-            }
-
-            call_func = getattr(requests, method.lower(), None)
+            # Determine the HTTP method to use
+            call_func = self._methods.get(method)
             if call_func is None:
                 raise ValueError("HTTP Method unknown, cannot continue.")
 
@@ -88,29 +236,161 @@ class _BaseApi:
 
             # Perform the API call
             response = call_func(
-                call_url, params=url_params, json=body, headers=headers
+                call_url,
+                params=url_params,
+                data=_dumps(body) if body is not None else None,
             )
 
             # Check if the request was successful
             response.raise_for_status()
 
-            # Deserialize the response if a schema is provided
-            # Deserialize the response if an in_schema is provided
-            deserialized_data = response.json()
-            self._handle_error_response(deserialized_data)
-
-            # Use nested_lookup to find the relevant part of the response
-            if output_base:
-                result = nested_lookup(deserialized_data, output_base)
-            else:
-                result = deserialized_data
-            if isinstance(result, list):
-                return out_schema().load(data=result, many=True)
-            return out_schema().load(data=result)
+            # Deserialize the part of the response we're interested in
+            result = self._decode_response(response.content, output_base)
+            return self._load_response(result, out_schema)
 
         except RequestException as re:
             raise ConnectionError(f"Request failed: {re}")
 
+    def async_session(self) -> "httpx.AsyncClient":
+        """
+        Create an async client for the API, sharing one connection pool between the requests made with it.
+
+        The client is bound to the running event loop, so one is created per batch and should be closed with
+        `async with`.
+
+        Returns:
+            httpx.AsyncClient: The client, with the API base url and headers set.
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for concurrent requests, install it with `pip install httpx`.")
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=_POOL_MAXSIZE, max_keepalive_connections=_POOL_MAXSIZE),
+        )
+
+    async def make_request_async(
+        self,
+        session: "httpx.AsyncClient",
+        url: str,
+        method: str = "GET",
+        url_params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        out_schema: Optional[Schema] = None,
+        output_base: Optional[Sequence[str]] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        The async version of `make_request`, sending the request with a client from `async_session`.
+
+        Args:
+            session (httpx.AsyncClient): The client to send the request with.
+            url (str): The endpoint URL.
+            method (str): One of GET, POST, PUT. Defaults to "GET".
+            url_params (Optional[Dict[str, Any]]): A dictionary of URL parameters.
+            body (Optional[Dict[str, Any]]): A dictionary containing the body request.
+            out_schema (Optional[Schema]): A schema to serialize the response from the API.
+            output_base (Optional[Sequence[str]]): The path of keys to the part of the response to deserialize.
+
+        Returns:
+            response (Union[Dict[str, Any], List[Dict[str, Any]]]): the api response
+        """
+        if method not in self._methods:
+            raise ValueError("HTTP Method unknown, cannot continue.")
+
+        try:
+            response = await session.request(
+                method,
+                url,
+                params=url_params,
+                content=_dumps(body) if body is not None else None,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as err:
+            raise ConnectionError(f"Request failed: {err}")
+
+        result = self._decode_response(response.content, output_base)
+        return self._load_response(result, out_schema)
+
+    def _load_response(self, result: Any, out_schema: Type[Schema]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Deserialize the decoded response data with the schema.
+        Args:
+            result (Any): The decoded response data.
+            out_schema (Type[Schema]): The schema to deserialize with.
+
+        Returns:
+            The deserialized data.
+        """
+        loader = LOADERS.get(out_schema)
+        if loader is not None and isinstance(result, list):
+            loaded = loader(result)
+            if loaded is not None:
+                return loaded
+
+        schema = _schema(out_schema)
+        if isinstance(result, list):
+            return schema.load(data=result, many=True)
+        return schema.load(data=result)
+
+    def _decode_response(
+        self, content: bytes, output_base: Optional[Sequence[str]] = None
+    ) -> Any:
+        """
+        Decode the response body, checking it for errors, and return the part found at `output_base`.
+        Args:
+            content (bytes): The raw response body.
+            output_base (Optional[Sequence[str]]): The path of keys to the part of the response to return.
+
+        Returns:
+            The decoded data at `output_base`, or the whole response if not given.
+
+        Raises:
+            ApiFieldException: If the API returned an error or the path isn't in the response.
+            ConnectionError: If the response isn't valid JSON.
+        """
+        if msgspec is not None and output_base:
+            # Only the path (and the status messages) is turned into python objects, everything else is skipped
+            try:
+                root = _subtree_decoder(tuple(output_base)).decode(content)
+            except msgspec.ValidationError:
+                root = None
+            except msgspec.DecodeError as err:
+                raise ConnectionError(f"Request failed: unable to decode response: {err}")
+
+            parent = getattr(root, output_base[0], None)
+            if parent is not None and len(output_base) == 1:
+                self._handle_error_response({output_base[0]: parent})
+                return parent
+            messages = getattr(parent, "Messages", None)
+            if parent is not None and not (isinstance(messages, dict) and messages.get("Code") == "ERROR"):
+                result = parent
+                for key in output_base[1:]:
+                    result = getattr(result, key)
+                    if result is None:
+                        break
+                else:
+                    return result
+            # Errors and unexpected responses are rare, decode everything and let the checks below report them
+
+        try:
+            deserialized_data = _loads(content)
+        except ValueError as err:
+            raise ConnectionError(f"Request failed: unable to decode response: {err}")
+        self._handle_error_response(deserialized_data)
+
+        # Walk down to the relevant part of the response
+        result = deserialized_data
+        if output_base:
+            try:
+                for key in output_base:
+                    result = result[key]
+            except (KeyError, TypeError):
+                raise ApiFieldException(
+                    f"API response is missing '{'.'.join(output_base)}': {deserialized_data}"
+                )
+        return result
+
     def _handle_error_response(self, jresp: Dict[str, Any]):
         """
         Handle a response from
@@ -121,44 +401,100 @@ class _BaseApi:
             None
 
         Raises:
-            ValidationError
+            ApiFieldException: If the API returned an error or the response isn't an object.
         """
+        if not isinstance(jresp, dict) or not jresp:
+            raise ApiFieldException(f"API returned an unexpected response: {jresp}")
+
+        main_key = next(iter(jresp))
+        root = jresp[main_key]
+
+        messages = root.get("Messages") if isinstance(root, dict) else None
+        if not isinstance(messages, dict) or messages.get("Code") != "ERROR":
+            return
+
+        child_key = main_key[:-1] if main_key.endswith("s") else None
+        if not child_key:
+            raise ApiFieldException(f"API returned error: {jresp}")
+
+        # The error details are optional and loosely shaped, anything unexpected is skipped so the error is
+        # always raised
+        error_text = ""
+        child = root.get(child_key)
+        child_messages = child.get("Messages") if isinstance(child, dict) else None
+        if isinstance(child_messages, dict):
+            description = child_messages.get("Description")
+            if description is not None:
+                error_text += f"{description} : "
+            errors = child_messages.get("ErrorFields")
+            if errors is not None:
+                if not isinstance(errors, list):
+                    errors = [errors]
+                for error in errors:
+                    error_field = error.get("ErrorField") if isinstance(error, dict) else None
+                    if isinstance(error_field, dict):
+                        field_name = str(error_field.get("FieldName", ""))
+                        if "_" not in field_name:
+                            field_name = camel_to_snake(field_name)
+                        error_text += f"FIELD {field_name}"
+                        error_text += f" - {error_field.get('ErrorMessage')}"
+
+        raise ApiFieldException(f"API returned error: {error_text}")
+
+
+def _float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _service_item(weight: Any, item_type: str, length: Any, width: Any, height: Any, value: Any) -> Dict[str, Any]:
+    """
+    Build the request body of an item, as `ItemSchema` dumps it.
+    """
+    return {
+        "Type": item_type,
+        "Weight": _float(weight),
+        "Length": _float(length),
+        "Width": _float(width),
+        "Height": _float(height),
+        "Value": _float(value),
+    }
 
-        main_key = list(jresp.keys())[0]
 
-        if jresp[main_key]["Messages"]["Code"] == "ERROR":
-            child_key = main_key[:-1] if main_key.endswith("s") else None
-            error_text = ""
+def _service_records(result: Union[Dict, List[Dict]]) -> Tuple[Dict, ...]:
+    """
+    Get the loaded services as a tuple, APC sends a single service as a bare object rather than a list of one.
+    """
+    return (result,) if isinstance(result, dict) else tuple(result)
 
-            if child_key:
-                error_value = jresp[main_key][child_key]
-                if "Messages" in error_value:
-                    if "Description" in error_value["Messages"]:
-                        error_text += f"{error_value['Messages']['Description']} : "
-                    if "ErrorFields" in error_value["Messages"]:
-                        errors = error_value["Messages"]["ErrorFields"]
-                        if not isinstance(errors, list):
-                            errors = [errors]
-                        for error in errors:
-                            if "ErrorField" in error:
-                                error_text += f"FIELD {camel_to_snake(error['ErrorField']['FieldName'])}"
-                                error_text += (
-                                    f" - {error['ErrorField']['ErrorMessage']}"
-                                )
-            else:
-                error_text = str(jresp)
 
-            raise ApiFieldException(f"API returned error: {error_text}")
+def _services(records: Tuple[Dict, ...]) -> Services:
+    """
+    Build `Services` from cached records, copying them so changes to the result don't reach the cache.
+    """
+    return Services([dict(record) for record in records])
 
 
 class _Service:
     endpoint: str = "/ServiceAvailability.json"
+    endpoint_schema: Schema = _schema(ServiceCheckSchema)
+    # Build request bodies with `endpoint_schema` instead of by hand, to check the two against each other
+    debug: bool = False
+    # How long in seconds services are cached for at most, they change through the day as booking cutoffs pass
+    cache_ttl: float = 300
     _company: Address
     _api: _BaseApi
 
     def __init__(self, api: _BaseApi, company: Address):
         self._company = company
         self._api = api
+        # Repeated quotes for the same shipment are answered without calling the API again
+        self._cached_services = lru_cache(maxsize=256)(self._fetch_services_for_period)
+
+    def clear_cache(self):
+        """
+        Clear the cached shipping services, so the next lookups are fetched from the API.
+        """
+        self._cached_services.cache_clear()
 
     def get_shipping_services(
         self,
@@ -192,6 +528,96 @@ class _Service:
             JSON: Available shipping services (Mocked for this example).
 
         """
+        query = self._service_query(
+            delivery_postal_code,
+            items,
+            delivery_country_code=delivery_country_code,
+            is_fragile=is_fragile,
+            order_value=order_value,
+            collection_date=collection_date,
+            ready_at=ready_at,
+            closed_at=closed_at,
+            collection_postal_code=collection_postal_code,
+            collection_country_code=collection_country_code,
+        )
+        api_response = self._cached_services(int(monotonic() // self.cache_ttl), *query)
+        if api_response is None:
+            return None
+        return _services(api_response)
+
+    async def get_shipping_services_batch_async(self, queries: List[Dict[str, Any]]) -> List[Optional[Services]]:
+        """
+        Retrieves the available shipping services for many shipments concurrently.
+
+        Identical queries in the batch are only sent once, the requests are sent over a shared connection pool
+        with up to the connection pool size in flight at once.
+
+        Args:
+            queries (List[Dict[str, Any]]): The keyword arguments of `get_shipping_services` for each shipment.
+
+        Returns:
+            List[Optional[Services]]: The available services, in the same order as `queries`.
+        """
+        keys = [self._service_query(**query) for query in queries]
+        payloads = {key: self._service_payload(*key) for key in keys}
+        semaphore = asyncio.Semaphore(_POOL_MAXSIZE)
+
+        async with self._api.async_session() as session:
+
+            async def fetch(payload: Optional[Dict[str, Any]]) -> Optional[Tuple[Dict, ...]]:
+                if payload is None:
+                    return None
+                async with semaphore:
+                    result = await self._api.make_request_async(
+                        session,
+                        url=self.endpoint,
+                        method="POST",
+                        body=payload,
+                        out_schema=CarrierSchema,
+                        output_base=("ServiceAvailability", "Services", "Service"),
+                    )
+                return _service_records(result)
+
+            responses = await asyncio.gather(*(fetch(payload) for payload in payloads.values()))
+
+        results = dict(zip(payloads, responses))
+        return [None if results[key] is None else _services(results[key]) for key in keys]
+
+    def get_shipping_services_batch(self, queries: List[Dict[str, Any]]) -> List[Optional[Services]]:
+        """
+        Retrieves the available shipping services for many shipments concurrently, see
+        `get_shipping_services_batch_async`.
+
+        Args:
+            queries (List[Dict[str, Any]]): The keyword arguments of `get_shipping_services` for each shipment.
+
+        Returns:
+            List[Optional[Services]]: The available services, in the same order as `queries`.
+        """
+        return asyncio.run(self.get_shipping_services_batch_async(queries))
+
+    def _service_query(
+        self,
+        delivery_postal_code: str,
+        items: Union[Item, List[Item]],
+        delivery_country_code: Optional[str] = "GB",
+        is_fragile: Optional[bool] = False,
+        order_value: Optional[int] = None,
+        collection_date: Optional[datetime.date] = None,
+        ready_at: Optional[time] = None,
+        closed_at: Optional[time] = None,
+        collection_postal_code: Optional[str] = None,
+        collection_country_code: Optional[str] = None,
+    ) -> Tuple[Any, ...]:
+        """
+        Fills in the defaults of a `get_shipping_services` query.
+
+        Returns:
+            Tuple[Any, ...]: The hashable arguments of `_service_payload` for the query.
+
+        Raises:
+            ValueError: If an item weight is outside the range `ItemSchema` allows.
+        """
         if collection_date is None:
             collection_date = datetime.datetime.now().date()
 
@@ -206,47 +632,149 @@ class _Service:
 
         if not isinstance(items, list):
             items = [items]
-        number_of_pieces = len(items)
 
-        # Construct the data dictionary
-        data = {
-            "orders": {
-                "order": {
-                    "collection_date": collection_date,
-                    "ready_at": ready_at,
-                    "closed_at": closed_at,
-                    "collection": {
-                        "postal_code": collection_postal_code,
-                        "country_code": collection_country_code,
-                    },
-                    "delivery": {
-                        "postal_code": delivery_postal_code,
-                        "country_code": delivery_country_code,
-                    },
-                    "goods_info": {"goods_value": order_value, "fragile": is_fragile},
-                    "shipment_details": {
-                        "numberof_pieces": number_of_pieces,
-                        "items": {"item": [item.to_dict() for item in items]},
-                    },
-                }
-            }
-        }
+        # Items are mutable, so they're keyed by their values
+        item_values = tuple(
+            (item.weight, item.type.value, item.length, item.width, item.height, item.value)
+            for item in items
+        )
 
-        # Validate the data using the Marshmallow schemas
+        # The request body isn't loaded through `ItemSchema`, so its weight range is checked here, comparing each
+        # weight so NaN is rejected wherever it is
         try:
-            result = ServiceCheckSchema().dump(data)
-        except ValidationError as err:
-            print(f"Validation errors: {err}")
+            in_range = all(0 <= values[0] <= 100 for values in item_values)
+        except TypeError:
+            in_range = False
+        if not in_range:
+            raise ValueError("Item weights must be numbers between 0 and 100.")
+
+        return (
+            delivery_postal_code,
+            delivery_country_code,
+            is_fragile,
+            order_value,
+            collection_date,
+            ready_at,
+            closed_at,
+            collection_postal_code,
+            collection_country_code,
+            item_values,
+        )
+
+    def _fetch_services_for_period(self, period: int, *query: Any) -> Optional[Tuple[Dict, ...]]:
+        """
+        Fetches the available shipping services, with the cache period as part of the cache key so cached
+        services expire when it changes.
+
+        Args:
+            period (int): The number of `cache_ttl` periods since an arbitrary point.
+            *query: The arguments of `_service_payload`, from `_service_query`.
+
+        Returns:
+            Optional[Tuple[Dict, ...]]: The available services, or None if the request data is invalid.
+        """
+        return self._fetch_services(*query)
+
+    def _fetch_services(self, *query: Any) -> Optional[Tuple[Dict, ...]]:
+        """
+        Fetches the available shipping services from the API, see `get_shipping_services`.
+
+        Args:
+            *query: The arguments of `_service_payload`, from `_service_query`.
+
+        Returns:
+            Optional[Tuple[Dict, ...]]: The available services, or None if the request data is invalid.
+        """
+        body = self._service_payload(*query)
+        if body is None:
             return None
 
-        api_response: List[Dict] = self._api.make_request(
+        result = self._api.make_request(
             url=self.endpoint,
             method="POST",
-            body=result,
+            body=body,
             out_schema=CarrierSchema,
-            output_base=["ServiceAvailability", "Services", "Service"],
+            output_base=("ServiceAvailability", "Services", "Service"),
         )
-        return Services(api_response)
+        return _service_records(result)
+
+    def _service_payload(
+        self,
+        delivery_postal_code: str,
+        delivery_country_code: str,
+        is_fragile: bool,
+        order_value: Optional[int],
+        collection_date: datetime.date,
+        ready_at: time,
+        closed_at: time,
+        collection_postal_code: str,
+        collection_country_code: str,
+        item_values: Tuple[Tuple[Any, ...], ...],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Builds the request body of a service availability query.
+
+        Args:
+            item_values (Tuple[Tuple[Any, ...], ...]): The weight, type, length, width, height and value of each item.
+
+        Returns:
+            Optional[Dict[str, Any]]: The request body, or None if the request data is invalid.
+        """
+        if self.debug:
+            goods_info = {"fragile": is_fragile}
+            if order_value is not None:
+                goods_info["order_value"] = order_value
+            data = {
+                "orders": {
+                    "order": {
+                        "collection_date": collection_date,
+                        "ready_at": ready_at,
+                        "closed_at": closed_at,
+                        "collection": {
+                            "postal_code": collection_postal_code,
+                            "country_code": collection_country_code,
+                        },
+                        "delivery": {
+                            "postal_code": delivery_postal_code,
+                            "country_code": delivery_country_code,
+                        },
+                        "goods_info": goods_info,
+                        "shipment_details": {
+                            "number_of_pieces": len(item_values),
+                            "items": {"item": [dict(zip(_ITEM_KEYS, values)) for values in item_values]},
+                        },
+                    }
+                }
+            }
+
+            # Validate the data using the Marshmallow schemas
+            try:
+                return self.endpoint_schema.dump(data)
+            except ValidationError as err:
+                print(f"Validation errors: {err}")
+                return None
+
+        # The body is built directly in the shape `endpoint_schema` dumps, it only renames and formats the values
+        goods_info = {"Fragile": is_fragile}
+        if order_value is not None:
+            goods_info = {"GoodsValue": float(order_value), "Fragile": is_fragile}
+        items = [_service_item(*values) for values in item_values]
+        return {
+            "Orders": {
+                "Order": {
+                    "CollectionDate": None if collection_date is None else collection_date.strftime("%d/%m/%Y"),
+                    "ReadyAt": None if ready_at is None else ready_at.strftime("%H:%M"),
+                    "ClosedAt": None if closed_at is None else closed_at.strftime("%H:%M"),
+                    "Collection": {"PostalCode": collection_postal_code, "CountryCode": collection_country_code},
+                    "Delivery": {"PostalCode": delivery_postal_code, "CountryCode": delivery_country_code},
+                    "GoodsInfo": goods_info,
+                    "ShipmentDetails": {
+                        "NumberOfPieces": len(items),
+                        "Items": {"Item": items[0] if len(items) == 1 else items},
+                    },
+                }
+            }
+        }
 
 
 class _Order:
@@ -277,7 +805,7 @@ class _Order:
         delivery_address: Address,
         items: Union[Item, List[Item]],
         ship_reference: Optional[str] = None,
-        collection_date: Optional[datetime.date] = datetime.date.today(),
+        collection_date: Optional[datetime.date] = None,
         delivery_instructions: Optional[str] = None,
         is_fragile: Optional[bool] = False,
         needs_increased_liability: Optional[bool] = False,
@@ -302,7 +830,41 @@ class _Order:
         Returns:
 
         """
-        return self._make_shipment_base(
+        return self._send(
+            self._delivery_payload(
+                service_code=service_code,
+                delivery_address=delivery_address,
+                items=items,
+                ship_reference=ship_reference,
+                collection_date=collection_date,
+                delivery_instructions=delivery_instructions,
+                is_fragile=is_fragile,
+                needs_increased_liability=needs_increased_liability,
+                order_value=order_value,
+                goods_description=goods_description,
+            )
+        )
+
+    def _delivery_payload(
+        self,
+        service_code: str,
+        delivery_address: Address,
+        items: Union[Item, List[Item]],
+        ship_reference: Optional[str] = None,
+        collection_date: Optional[datetime.date] = None,
+        delivery_instructions: Optional[str] = None,
+        is_fragile: Optional[bool] = False,
+        needs_increased_liability: Optional[bool] = False,
+        order_value: Optional[float] = None,
+        goods_description: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds the validated request body for a delivery, see `make_delivery` for the arguments.
+        """
+        if collection_date is None:
+            collection_date = datetime.date.today()
+
+        return self._shipment_payload(
             is_collection=False,
             service_code=service_code,
             customer_address=delivery_address,
@@ -322,7 +884,7 @@ class _Order:
         collection_address: Address,
         items: Union[Item, List[Item]],
         ship_reference: Optional[str] = None,
-        collection_date: Optional[datetime.date] = datetime.date.today(),
+        collection_date: Optional[datetime.date] = None,
         collection_instructions: Optional[str] = None,
         is_fragile: Optional[bool] = False,
         needs_increased_liability: Optional[bool] = False,
@@ -348,22 +910,27 @@ class _Order:
         Returns:
 
         """
-        return self._make_shipment_base(
-            is_collection=True,
-            service_code=service_code,
-            customer_address=collection_address,
-            collection_date=collection_date,
-            items=items,
-            delivery_instructions=collection_instructions,
-            ship_reference=ship_reference,
-            collection_address=collection_address,
-            is_fragile=is_fragile,
-            needs_increased_liability=needs_increased_liability,
-            order_value=order_value,
-            goods_description=goods_description,
+        if collection_date is None:
+            collection_date = datetime.date.today()
+
+        return self._send(
+            self._shipment_payload(
+                is_collection=True,
+                service_code=service_code,
+                customer_address=collection_address,
+                collection_date=collection_date,
+                items=items,
+                delivery_instructions=collection_instructions,
+                ship_reference=ship_reference,
+                collection_address=collection_address,
+                is_fragile=is_fragile,
+                needs_increased_liability=needs_increased_liability,
+                order_value=order_value,
+                goods_description=goods_description,
+            )
         )
 
-    def _make_shipment_base(
+    def _shipment_payload(
         self,
         service_code: str,
         customer_address: Address,
@@ -377,9 +944,9 @@ class _Order:
         needs_increased_liability: Optional[bool] = False,
         order_value: Optional[float] = None,
         goods_description: Optional[str] = None,
-    ):
+    ) -> Dict[str, Any]:
         """
-        Books a shipment.
+        Builds the validated request body for a shipment.
 
         Args:
             service_code (str): The APC Service code to use
@@ -438,7 +1005,7 @@ class _Order:
                     },
                     "shipment_details": {
                         "number_of_pieces": number_of_pieces,
-                        "items": {"item": [item.to_dict() for item in items]},
+                        "items": {"item": list(map(Item.to_dict, items))},
                     },
                 }
             }
@@ -446,21 +1013,74 @@ class _Order:
 
         # Data Validation
         try:
-            validated_data = ExtendedFullOrderSchema().dump(data)
+            return dump_order(data)
         except ValidationError as err:
             raise ValidationError(f"Validation errors: {err}")
 
-        # API call
-        api_response: Dict = self._api.make_request(
+    def _send(self, payload: Dict[str, Any]) -> Dict:
+        """
+        Books a shipment with the API.
+        Args:
+            payload (Dict[str, Any]): The validated request body.
+
+        Returns:
+            Dict: The deserialized API response.
+        """
+        return self._api.make_request(
             url=self.endpoint,
             method="POST",
-            body=validated_data,
-            output_base=["Orders", "Order"],
+            body=payload,
+            output_base=("Orders", "Order"),
             out_schema=OrderOutputApiResponseSchema
         )
 
-        # Return deserialized API response
-        return api_response
+    async def make_deliveries_async(self, deliveries: List[Dict[str, Any]]) -> List[Union[Dict, Exception]]:
+        """
+        Books many deliveries concurrently.
+
+        The request bodies are built up front, then the requests are sent over a shared connection pool with up
+        to the connection pool size in flight at once.
+
+        A failed booking doesn't stop the others, its exception (e.g. `ConnectionError` or `ApiFieldException`)
+        is returned in its place. Bookings aren't idempotent, so check each result before retrying any of them.
+
+        Args:
+            deliveries (List[Dict[str, Any]]): The keyword arguments of `make_delivery` for each delivery.
+
+        Returns:
+            List[Union[Dict, Exception]]: The deserialized API response, or the exception raised, for each
+            delivery, in the same order as `deliveries`.
+        """
+        payloads = [self._delivery_payload(**delivery) for delivery in deliveries]
+        semaphore = asyncio.Semaphore(_POOL_MAXSIZE)
+
+        async with self._api.async_session() as session:
+
+            async def send(payload: Dict[str, Any]) -> Dict:
+                async with semaphore:
+                    return await self._api.make_request_async(
+                        session,
+                        url=self.endpoint,
+                        method="POST",
+                        body=payload,
+                        output_base=("Orders", "Order"),
+                        out_schema=OrderOutputApiResponseSchema,
+                    )
+
+            return await asyncio.gather(*(send(payload) for payload in payloads), return_exceptions=True)
+
+    def make_deliveries(self, deliveries: List[Dict[str, Any]]) -> List[Union[Dict, Exception]]:
+        """
+        Books many deliveries concurrently, see `make_deliveries_async`.
+
+        Args:
+            deliveries (List[Dict[str, Any]]): The keyword arguments of `make_delivery` for each delivery.
+
+        Returns:
+            List[Union[Dict, Exception]]: The deserialized API response, or the exception raised, for each
+            delivery, in the same order as `deliveries`.
+        """
+        return asyncio.run(self.make_deliveries_async(deliveries))
 
 
 class APC:
@@ -502,6 +1122,16 @@ class APC:
         """
         return f"<APC API company='{self.company.company_name}'>"
 
+    def close(self) -> None:
+        """Close the connections kept open to the API."""
+        self._api.close()
+
+    def __enter__(self) -> "APC":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def validate(self):
         """
         Companies use the default address dataclass but need to have and opening and closing time which it doesn't
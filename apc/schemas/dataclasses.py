@@ -1,10 +1,14 @@
-from dataclasses import dataclass, asdict, field
+import sys
+from dataclasses import dataclass, field
 from datetime import time
 from enum import Enum
 from typing import Optional
 
 from apc.schemas.validation import validate_country_code
 
+# slots cut the per-instance memory and attribute access cost, but are only supported from python 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ItemType(Enum):
     """Enumerates the acceptable item types."""
@@ -17,7 +21,7 @@ class ItemType(Enum):
     ALL = "ALL"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Item:
 
     """Represents an Item for shipping.
@@ -43,12 +47,17 @@ class Item:
             raise ValueError(f"Invalid item type: {self.type}")
     def to_dict(self):
 
-        out = asdict(self)
-        out["type"] = out["type"].value
-        return out
+        return {
+            "weight": self.weight,
+            "type": self.type.value,
+            "length": self.length,
+            "width": self.width,
+            "height": self.height,
+            "value": self.value,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Address:
     """Dataclass representing a company's details.
 
@@ -87,9 +96,10 @@ class Address:
         Returns:
             None
         Raises:
-            ValidationError: If the country code is invalid.
+            ValueError: If the country code is invalid.
         """
-        validate_country_code(self.country_code)
+        if not validate_country_code(self.country_code):
+            raise ValueError(f"Invalid country code: {self.country_code}")
         if self.address_line1 is None or self.address_line1 == "":
             raise ValueError("Address line 1 is required.")
         if self.postal_code is None or self.postal_code == "":
@@ -103,11 +113,20 @@ class Address:
         Returns:
             dict: A dictionary representation of the Company object.
         """
-        data = asdict(self)
-        data["contact"] = {
-            "person_name": data.pop("person_name"),
-            "phone_number": data.pop("phone_number"),
-            "mobile_number": data.pop("mobile_number"),
-            "email": data.pop("email")
+        return {
+            "company_name": self.company_name,
+            "address_line1": self.address_line1,
+            "city": self.city,
+            "postal_code": self.postal_code,
+            "open_from": self.open_from,
+            "open_to": self.open_to,
+            "address_line2": self.address_line2,
+            "county": self.county,
+            "country_code": self.country_code,
+            "contact": {
+                "person_name": self.person_name,
+                "phone_number": self.phone_number,
+                "mobile_number": self.mobile_number,
+                "email": self.email,
+            },
         }
-        return data
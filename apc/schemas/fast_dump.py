@@ -0,0 +1,202 @@
+from functools import partial
+from typing import Any, Callable, Dict, List, Type
+
+from marshmallow import Schema, fields, missing
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+
+from apc.schemas.schemas import ExtendedFullOrderSchema
+
+Dumper = Callable[[Any], Any]
+
+
+def _has_expected_internals(schema: Schema) -> bool:
+    """
+    Check that the private marshmallow attributes read by the generator have the structure of the tested
+    marshmallow releases (3.22 up to 4), so a release changing them falls back to `Schema.dump` instead of
+    producing a dumper that skips hooks or fields.
+
+    Every dump hook found through the decorators' `__marshmallow_hook__` marker has to be listed in
+    `_hooks[tag]` as an `(attr_name, many, kwargs)` entry.
+
+    Args:
+        schema (Schema): The schema instance.
+
+    Returns:
+        bool: True if the internals are as expected, False otherwise.
+    """
+    try:
+        resolved = {
+            tag: {hook[0] for hook in schema._hooks[tag] if len(hook) == 3 and isinstance(hook[2], dict)}
+            for tag in (PRE_DUMP, POST_DUMP)
+        }
+        schema_cls = type(schema)
+        for attr_name in dir(schema_cls):
+            config = getattr(getattr(schema_cls, attr_name, None), "__marshmallow_hook__", None) or {}
+            for key in config:
+                # keyed by tag, or by (tag, many) in older releases
+                tag = key[0] if isinstance(key, tuple) else key
+                if tag in resolved and attr_name not in resolved[tag]:
+                    return False
+        return (
+            isinstance(schema.dump_fields, dict)
+            and all(isinstance(field._CHECK_ATTRIBUTE, bool) for field in schema.dump_fields.values())
+            and isinstance(fields.DateTime.SERIALIZATION_FUNCS, dict)
+        )
+    except (AttributeError, KeyError, TypeError):
+        return False
+
+
+def _is_simple(schema: Schema) -> bool:
+    """
+    Check whether a schema only uses features the generated dumpers reproduce.
+    Args:
+        schema (Schema): The schema instance.
+
+    Returns:
+        bool: True if a dumper can be generated for the schema, False otherwise.
+    """
+    return (
+        _has_expected_internals(schema)
+        and schema.only is None
+        and not schema.exclude
+        and type(schema).get_attribute is Schema.get_attribute
+        and not schema._hooks[PRE_DUMP]
+        and not any(hook_many or kwargs.get("pass_original") for _, hook_many, kwargs in schema._hooks[POST_DUMP])
+    )
+
+
+class _Compiler:
+    """Generates one dump function per schema class, sharing the functions of nested schemas."""
+
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {"_missing": missing}
+        self.dumpers: Dict[Type[Schema], str] = {}
+        self.sources: List[str] = []
+
+    def _const(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def _nested(self, field: fields.Nested) -> str:
+        """
+        Get the name of the dumper used for a single object of a nested field's schema.
+        """
+        schema = field.schema
+        if not _is_simple(schema):
+            return self._const(partial(schema.dump, many=False))
+        return self.schema(schema)
+
+    def _value(self, field: fields.Field, var: str) -> str:
+        """
+        Build the expression serializing `var` (never None) for the given field.
+        """
+        serialize = type(field)._serialize
+        if serialize is fields.String._serialize:
+            return f"str({var})"
+        if serialize is fields.Number._serialize and not field.as_string and field.num_type in (int, float):
+            return f"{field.num_type.__name__}({var})"
+        if serialize is fields.DateTime._serialize:
+            data_format = field.format or field.DEFAULT_FORMAT
+            if data_format not in field.SERIALIZATION_FUNCS:
+                return f"{var}.strftime({data_format!r})"
+        if serialize is fields.Nested._serialize:
+            if field.many:
+                return f"[{self._nested(field)}(_i) for _i in {var}]"
+            return f"{self._nested(field)}({var})"
+        if serialize is fields.List._serialize and type(field.inner)._serialize is fields.Nested._serialize:
+            inner = self._nested(field.inner)
+            return f"[None if _i is None else {inner}(_i) for _i in {var}]"
+        return f"{self._const(field._serialize)}({var}, None, None)"
+
+    def schema(self, schema: Schema) -> str:
+        """
+        Generate the dumper for a schema, returning the name it is bound to in the namespace.
+        """
+        schema_cls = type(schema)
+        if schema_cls in self.dumpers:
+            return self.dumpers[schema_cls]
+
+        name = f"_dump_{schema_cls.__name__}_{len(self.dumpers)}"
+        self.dumpers[schema_cls] = name
+        # the schema may be a nested `many` instance, the generated function always dumps a single object
+        fallback = self._const(partial(schema.dump, many=False))
+
+        lines = [
+            f"def {name}(obj):",
+            "    if type(obj) is not dict:",
+            f"        return {fallback}(obj)",
+            "    out = {}",
+        ]
+        for attr_name, field in schema.dump_fields.items():
+            key = field.data_key if field.data_key is not None else attr_name
+            attribute = field.attribute or attr_name
+            if not field._CHECK_ATTRIBUTE or type(field).get_value is not fields.Field.get_value or "." in attribute:
+                lines += [
+                    f"    v = {self._const(field.serialize)}({attr_name!r}, obj, accessor={self._const(schema.get_attribute)})",
+                    "    if v is not _missing:",
+                    f"        out[{key!r}] = v",
+                ]
+                continue
+
+            lines.append(f"    v = obj.get({attribute!r}, _missing)")
+            if field.dump_default is not missing:
+                default = self._const(field.dump_default)
+                value = f"{default}()" if callable(field.dump_default) else default
+                lines += ["    if v is _missing:", f"        v = {value}"]
+            lines += [
+                "    if v is not _missing:",
+                f"        out[{key!r}] = None if v is None else {self._value(field, 'v')}",
+            ]
+
+        for attr_name, _, _ in schema._hooks[POST_DUMP]:
+            lines.append(f"    out = {self._const(getattr(schema, attr_name))}(out, many=False)")
+        lines.append("    return out")
+
+        self.sources.append("\n".join(lines))
+        return name
+
+
+def compile_dumper(schema_cls: Type[Schema]) -> Dumper:
+    """
+    Compile a function producing the same output as `schema_cls().dump(data)` for plain dict data.
+
+    Field names are resolved once here and written into the generated source as literals, so dumping
+    skips marshmallow's per-field dispatch. Anything the generator doesn't reproduce (custom accessors,
+    pre_dump hooks, non-dict values, unexpected marshmallow internals etc.) is delegated back to marshmallow.
+
+    Args:
+        schema_cls (Type[Schema]): The schema class to compile.
+
+    Returns:
+        Callable: The dump function.
+    """
+    schema = schema_cls()
+    if not _is_simple(schema):
+        return schema.dump
+
+    compiler = _Compiler()
+    name = compiler.schema(schema)
+    exec(compile("\n\n".join(compiler.sources), f"<dump {schema_cls.__name__}>", "exec"), compiler.namespace)
+    return compiler.namespace[name]
+
+
+def get_dumper(schema_cls: Type[Schema]) -> Dumper:
+    """
+    Get the compiled dump function of a schema class, compiling it on first use and keeping it on the class
+    as `_fast_dump`.
+    Args:
+        schema_cls (Type[Schema]): The schema class.
+
+    Returns:
+        Callable: The dump function, see `compile_dumper`.
+    """
+    # looked up in the class' own namespace, so subclasses don't reuse the dumper of their parent
+    dumper = schema_cls.__dict__.get("_fast_dump")
+    if dumper is None:
+        dumper = compile_dumper(schema_cls)
+        schema_cls._fast_dump = dumper
+    return dumper
+
+
+dump_order = get_dumper(ExtendedFullOrderSchema)
@@ -0,0 +1,98 @@
+from math import isfinite
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from marshmallow import Schema, fields, missing
+
+from apc.schemas.schemas import CarrierSchema
+from apc.schemas.utilities import parse_datetime
+
+Loader = Callable[[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]]
+
+# Loaders producing the same records as `Schema().load(data, many=True)`, keyed by the schema they replace
+LOADERS: Dict[Type[Schema], Loader] = {}
+
+
+def _string(value: Any) -> str:
+    if type(value) is not str:
+        raise TypeError(f"Not a valid string: {value!r}")
+    return value
+
+
+def _integer(value: Any) -> int:
+    if type(value) is not int and type(value) is not str:
+        raise TypeError(f"Not a valid integer: {value!r}")
+    return int(value)
+
+
+def _float(value: Any) -> float:
+    if type(value) is not float and type(value) is not int and type(value) is not str:
+        raise TypeError(f"Not a valid number: {value!r}")
+    value = float(value)
+    if not isfinite(value):
+        raise ValueError(f"Not a valid number: {value!r}")
+    return value
+
+
+def _boolean(value: Any) -> bool:
+    if value in fields.Boolean.truthy:
+        return True
+    if value in fields.Boolean.falsy:
+        return False
+    raise ValueError(f"Not a valid boolean: {value!r}")
+
+
+def _converter(field: fields.Field) -> Callable[[Any], Any]:
+    """
+    Get a function converting a JSON value as the field loads it, raising TypeError or ValueError where the
+    field would report an error or where the value isn't handled here.
+    Args:
+        field (fields.Field): The schema field.
+
+    Returns:
+        Callable: The conversion function.
+    """
+    if isinstance(field, fields.DateTime) and field.format not in field.DESERIALIZATION_FUNCS:
+        return lambda value, data_format=field.format: parse_datetime(value, data_format)
+    converter = {fields.String: _string, fields.Integer: _integer, fields.Float: _float, fields.Boolean: _boolean}
+    if type(field) not in converter:
+        raise TypeError(f"Unsupported field type {type(field).__name__}")
+    return converter[type(field)]
+
+
+# The API key, field name and conversion of each loaded carrier field, resolved once from the schema
+_CARRIER_KEYS = tuple(
+    (field.data_key, name, _converter(field))
+    for name, field in CarrierSchema._declared_fields.items()
+    if not field.dump_only
+)
+
+
+def map_carriers(records: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load carrier records by mapping each key directly, in place of `CarrierSchema().load(records, many=True)`.
+    Args:
+        records (List[Dict[str, Any]]): The carrier records from the API.
+
+    Returns:
+        The loaded records, without missing fields, or None if a value doesn't convert and the records
+        should be loaded by the schema instead.
+    """
+    try:
+        loaded = []
+        for record in records:
+            data = {}
+            for key, name, convert in _CARRIER_KEYS:
+                value = record.get(key, missing)
+                if value is missing:
+                    continue
+                if value is None:
+                    # the fields don't allow null, leave the schema to report it
+                    return None
+                data[name] = convert(value)
+            loaded.append(data)
+        return loaded
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+LOADERS[CarrierSchema] = map_carriers
@@ -1,10 +1,105 @@
-from typing import List, Callable, Union
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Callable, Optional, Tuple, Type, Union
 
 from marshmallow import Schema
 
 from apc.schemas.schemas import CarrierSchema
 
 
+# The source of each condition's check, `{field}` is the record value with strings lowercased
+_CONDITION_SOURCE = {
+    "==": "{field} == {value}",
+    "!=": "{field} != {value}",
+    "<": "{field} < {value}",
+    "<=": "{field} <= {value}",
+    ">": "{field} > {value}",
+    ">=": "{field} >= {value}",
+    "like": "{value} in {field}",
+    "startswith": "{field}.startswith({value})",
+    "endswith": "{field}.endswith({value})",
+    "is_null": "r.get({name!r}) is None",
+    "is_not_null": "r.get({name!r}) is not None",
+}
+
+# Ops where a record missing the field is compared as an empty string
+_DEFAULT_EMPTY = {"like", "startswith", "endswith"}
+
+
+@lru_cache(maxsize=256)
+def _predicate_factory(signature: Tuple[Optional[Tuple[str, str]], ...]) -> Callable:
+    """
+    Generate a function building the predicate for a sequence of conditions.
+
+    The field names and comparisons are written into the generated source, only the compared values
+    (and any plain callables) are bound when the predicate is built, so one factory serves every
+    filter of the same shape.
+
+    Args:
+        signature: An `(op, name)` pair per condition, or None for a plain callable.
+
+    Returns:
+        Callable: The factory, taking one value per condition and returning the predicate.
+    """
+    args, checks = [], []
+    for position, condition in enumerate(signature):
+        arg = f"v{position}"
+        args.append(arg)
+        if condition is None:
+            checks.append(f"{arg}(r)")
+            continue
+        op, name = condition
+        default = ", ''" if op in _DEFAULT_EMPTY else ""
+        field = f"(x.lower() if isinstance(x := r.get({name!r}{default}), str) else x)"
+        checks.append(f"({_CONDITION_SOURCE[op].format(field=field, value=arg, name=name)})")
+
+    source = (
+        f"def _factory({', '.join(args)}):\n"
+        f"    def _predicate(r):\n"
+        f"        return {' and '.join(checks) or 'True'}\n"
+        f"    return _predicate\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<filter>", "exec"), namespace)
+    return namespace["_factory"]
+
+
+def _compile(conditions: Tuple[Callable, ...]) -> Callable[[dict], bool]:
+    """
+    Fuse conditions into a single predicate function.
+    Args:
+        conditions: The conditions, `Condition` objects or any callable taking a record.
+
+    Returns:
+        Callable: A function returning True if the record matches all conditions.
+    """
+    signature = tuple(
+        (condition.op, condition.name) if isinstance(condition, Condition) else None for condition in conditions
+    )
+    values = [condition.value if isinstance(condition, Condition) else condition for condition in conditions]
+    return _predicate_factory(signature)(*values)
+
+
+class Condition:
+    """A comparison of a record field against a value, created by the `QueryableAttribute` operators."""
+
+    __slots__ = ("op", "name", "value", "_predicate")
+
+    def __init__(self, op: str, name: str, value: Any = None) -> None:
+        self.op = op
+        self.name = name
+        self.value = value
+        self._predicate = None
+
+    def __call__(self, obj: dict) -> bool:
+        if self._predicate is None:
+            self._predicate = _compile((self,))
+        return self._predicate(obj)
+
+    def __repr__(self) -> str:
+        return f"<Condition {self.name} {self.op} {self.value!r}>"
+
+
 class QueryableAttribute:
     def __init__(self, name: str) -> None:
         self.name = name
@@ -13,22 +108,22 @@ class QueryableAttribute:
         return value.lower() if isinstance(value, str) else value
 
     def __eq__(self, other: Union[int, str, bool]) -> Callable:
-        return lambda obj: self._normalize(obj.get(self.name)) == self._normalize(other)
+        return Condition("==", self.name, self._normalize(other))
 
     def __ne__(self, other: Union[int, str, bool]) -> Callable:
-        return lambda obj: self._normalize(obj.get(self.name)) != self._normalize(other)
+        return Condition("!=", self.name, self._normalize(other))
 
     def __lt__(self, other: Union[int, str, bool]) -> Callable:
-        return lambda obj: self._normalize(obj.get(self.name)) < self._normalize(other)
+        return Condition("<", self.name, self._normalize(other))
 
     def __le__(self, other: Union[int, str, bool]) -> Callable:
-        return lambda obj: self._normalize(obj.get(self.name)) <= self._normalize(other)
+        return Condition("<=", self.name, self._normalize(other))
 
     def __gt__(self, other: Union[int, str, bool]) -> Callable:
-        return lambda obj: self._normalize(obj.get(self.name)) > self._normalize(other)
+        return Condition(">", self.name, self._normalize(other))
 
     def __ge__(self, other: Union[int, str, bool]) -> Callable:
-        return lambda obj: self._normalize(obj.get(self.name)) >= self._normalize(other)
+        return Condition(">=", self.name, self._normalize(other))
 
     def like(self, pattern: str) -> Callable:
         """
@@ -39,7 +134,7 @@ class QueryableAttribute:
         Returns:
             A function that returns True if the attribute value is like the given pattern, False otherwise.
         """
-        return lambda obj: self._normalize(pattern) in self._normalize(obj.get(self.name, ''))
+        return Condition("like", self.name, self._normalize(pattern))
 
     def startswith(self, prefix: str) -> Callable:
         """
@@ -49,7 +144,7 @@ class QueryableAttribute:
         Returns:
             A function that returns True if the attribute value starts with the given prefix, False otherwise.
         """
-        return lambda obj: self._normalize(obj.get(self.name, '')).startswith(self._normalize(prefix))
+        return Condition("startswith", self.name, self._normalize(prefix))
 
     def endswith(self, suffix: str) -> Callable:
         """
@@ -60,7 +155,7 @@ class QueryableAttribute:
         Returns:
             A function that returns True if the attribute value ends with the given suffix, False otherwise.
         """
-        return lambda obj: self._normalize(obj.get(self.name, '')).endswith(self._normalize(suffix))
+        return Condition("endswith", self.name, self._normalize(suffix))
 
     def is_null(self) -> Callable:
         """
@@ -69,7 +164,7 @@ class QueryableAttribute:
             A function that returns True if the attribute value is null, False otherwise.
 
         """
-        return lambda obj: obj.get(self.name) is None
+        return Condition("is_null", self.name)
 
     def is_not_null(self) -> Callable:
         """
@@ -77,9 +172,16 @@ class QueryableAttribute:
         Returns:
             A function that returns True if the attribute value is not null, False otherwise.
         """
-        return lambda obj: obj.get(self.name) is not None
+        return Condition("is_not_null", self.name)
 
 class Query:
+    __slots__ = ("records", "_indexes")
+
+    def __new__(cls, records: List[dict], schema: Optional[Type[Schema]] = None) -> "Query":
+        # a plain Query is built as the subclass for its schema, so each schema's attributes stay on its own class
+        if cls is Query:
+            cls = _schema_query(schema)
+        return super().__new__(cls)
 
     def __init__(self, records: List[dict], schema: Schema) -> None:
         """Initialize a Query object.
@@ -88,22 +190,71 @@ class Query:
             records (List[dict]): The records to query.
         """
         self.records = records
+        # The values each field index was built from, and the positions of each normalized value
+        self._indexes: Dict[str, Tuple[List[Any], Optional[Dict[Any, List[int]]]]] = {}
         self.set_queryable_attributes(schema)
 
     def set_queryable_attributes(self, schema: Schema) -> None:
-        for field_name in schema().fields.keys():
-            setattr(self, field_name, QueryableAttribute(field_name))
+        """
+        Install a `QueryableAttribute` for each of the schema's fields on the class, once per class and schema.
+        Args:
+            schema (Schema): The schema class describing the records.
+        """
+        cls = self.__class__
+        # read from the class' own namespace, so subclasses install their own attributes
+        installed = cls.__dict__.get("_queryable_schemas")
+        if installed is None:
+            installed = set()
+            cls._queryable_schemas = installed
+        if schema in installed:
+            return
+        installed.add(schema)
+        for field_name in schema().fields:
+            if not hasattr(cls, field_name):
+                setattr(cls, field_name, QueryableAttribute(field_name))
+
+    def _index(self, field: str) -> Optional[Dict[Any, List[int]]]:
+        """
+        Get the mapping of each value of a field to the positions of the records holding it.
 
-    def __getattr__(self, attr: str) -> QueryableAttribute:
-        """Dynamic attribute access.
+        The records can be changed after the index is built, so the field's current values are read on each
+        use and the index is rebuilt if they differ from the ones it was built from.
 
         Args:
-            attr (str): Attribute name.
+            field (str): The field name.
+
+        Returns:
+            The index, or None if the field holds unhashable values and can't be indexed.
+        """
+        values = [record.get(field) for record in self.records]
+        built = self._indexes.get(field)
+        if built is not None and built[0] == values:
+            return built[1]
+        index = defaultdict(list)
+        try:
+            for position, value in enumerate(values):
+                index[value.lower() if isinstance(value, str) else value].append(position)
+        except TypeError:
+            index = None
+        self._indexes[field] = (values, index)
+        return index
+
+    def _lookup(self, condition: Condition) -> Optional[List[int]]:
+        """
+        Find the positions of the records matching an equality condition using the field index.
+        Args:
+            condition (Condition): The equality condition.
 
         Returns:
-            QueryableAttribute: Queryable attribute object.
+            The matching positions, or None if the condition can't be answered from the index.
         """
-        return QueryableAttribute(attr)
+        index = self._index(condition.name)
+        if index is None:
+            return None
+        try:
+            return index.get(condition.value, [])
+        except TypeError:
+            return None
 
     def __getitem__(self, index: int) -> dict:
         """Get an item from the records' list by its index."""
@@ -123,10 +274,59 @@ class Query:
         Returns:
             A new instance of the class containing the filtered records.
         """
-        filtered = self.records
+        positions = None
+        remaining = []
         for condition in conditions:
-            filtered = [record for record in filtered if condition(record)]
-        return self.__class__(filtered)
+            is_equality = isinstance(condition, Condition) and condition.op == "=="
+            matches = self._lookup(condition) if is_equality else None
+            if matches is None:
+                remaining.append(condition)
+            elif positions is None:
+                positions = matches
+            else:
+                matches = set(matches)
+                positions = [position for position in positions if position in matches]
+
+        records = self.records
+        if positions is not None:
+            records = [records[position] for position in positions]
+        if remaining:
+            predicate = _compile(tuple(remaining))
+            records = [record for record in records if predicate(record)]
+        elif positions is None:
+            records = list(records)
+        return self.__class__(records)
+
+    def filter_eq(self, field: str, value: Any) -> "Query":
+        """
+        Filter the records to those where the field equals the value, using the field index.
+
+        Args:
+            field (str): The field name.
+            value (Any): The value to match, strings are matched case-insensitively.
+
+        Returns:
+            A new instance of the class containing the filtered records.
+        """
+        return self.filter(Condition("==", field, value.lower() if isinstance(value, str) else value))
+
+@lru_cache(maxsize=None)
+def _schema_query(schema: Type[Schema]) -> Type[Query]:
+    """
+    Get the `Query` subclass for the records of a schema, which holds the schema's queryable attributes and
+    passes the schema on to the queries created by `filter`.
+    Args:
+        schema (Type[Schema]): The schema class describing the records.
+
+    Returns:
+        Type[Query]: The subclass, created once per schema.
+    """
+
+    def __init__(self, records: List[dict], schema: Type[Schema] = schema) -> None:
+        Query.__init__(self, records, schema)
+
+    return type(f"{schema.__name__}Query", (Query,), {"__slots__": (), "__init__": __init__})
+
 
 class Services(Query):
     """Class representing a list of services."""
@@ -147,5 +347,8 @@ class Services(Query):
     collection_date: QueryableAttribute
     estimated_delivery_date: QueryableAttribute
     latest_booking_date_time: QueryableAttribute
+
+    __slots__ = ()
+
     def __init__(self, services: List[dict]):
         super().__init__(services, CarrierSchema)
@@ -1,9 +1,22 @@
-from marshmallow import Schema, fields, validate, validates, ValidationError, post_dump, post_load, EXCLUDE, pre_load
+from marshmallow import Schema, fields, validate, validates, ValidationError, post_dump, post_load, EXCLUDE
 
+from apc.schemas.utilities import parse_datetime
 from apc.schemas.validation import validate_country_code
 
+try:
+    import re2 as re  # linear time matching, same API as `re`
+except ImportError:  # pragma: no cover - re2 is an optional speedup
+    import re
 
-# Function to check if country code is valid
+_POSTCODE_RE = re.compile(
+    r"^(([A-Z]{1,2}[0-9][A-Z0-9]?|ASCN|STHL|TDCU|BBND|[BFS]IQQ|PCRN|TKCA) ?[0-9][A-Z]{2}|BFPO ?[0-9]{1,4}|(KY[0-9]|MSR|VG|AI)[ -]?[0-9]{4}|[A-Z]{2} ?[0-9]{2}|GE ?CX|GIR ?0A{2}|SAN ?TA1)$"
+)
+
+
+# Function to check if postal code is valid
+def _validate_postcode(value):
+    if _POSTCODE_RE.match(value) is None:
+        raise ValidationError("Invalid Postal Code format.")
 
 
 class ItemSchema(Schema):
@@ -17,14 +30,40 @@ class ItemSchema(Schema):
     value = fields.Float(data_key="Value")
 
 
+class DateTimeField(fields.DateTime):
+    """A date time in one of the API's fixed formats, parsed with the cached `parse_datetime`."""
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        try:
+            return parse_datetime(value, self.format)
+        except (TypeError, ValueError):
+            # let the field report the error
+            return super()._deserialize(value, attr, data, **kwargs)
+
+
+class ItemListField(fields.Nested):
+    """A list of nested items, where the API sends a single item without the list."""
+
+    def __init__(self, nested, **kwargs):
+        super().__init__(nested, many=True, **kwargs)
+
+    def _deserialize(self, value, attr, data, partial=None, **kwargs):
+        if type(value) is not list:
+            value = [value]
+        return super()._deserialize(value, attr, data, partial=partial, **kwargs)
+
+
 class ItemsSchema(Schema):
-    item = fields.List(fields.Nested(ItemSchema), data_key="Item", required=True)
+    item = ItemListField(ItemSchema, data_key="Item", required=True)
 
     @post_dump
     def handle_single_item(self, data, **kwargs):
-        if len(data['Item']) == 1:
-            data['Item'] = data['Item'][0]
+        if "Item" in data:
+            item = data["Item"]
+            data["Item"] = item[0] if type(item) is list and len(item) == 1 else item
         return data
+
+
 class ShipmentDetailsSchema(Schema):
     number_of_pieces = fields.Int(data_key="NumberOfPieces", required=True)
     items = fields.Nested(ItemsSchema(), data_key="Items", required=True)
@@ -33,9 +72,7 @@ class ShipmentDetailsSchema(Schema):
 
 
 class AddressSchema(Schema):
-    postal_code = fields.Str(data_key="PostalCode", required=True, validate=validate.Regexp(
-        r"^(([A-Z]{1,2}[0-9][A-Z0-9]?|ASCN|STHL|TDCU|BBND|[BFS]IQQ|PCRN|TKCA) ?[0-9][A-Z]{2}|BFPO ?[0-9]{1,4}|(KY[0-9]|MSR|VG|AI)[ -]?[0-9]{4}|[A-Z]{2} ?[0-9]{2}|GE ?CX|GIR ?0A{2}|SAN ?TA1)$"),
-                            error="Invalid Postal Code format.")
+    postal_code = fields.Str(data_key="PostalCode", required=True, validate=_validate_postcode)
     country_code = fields.Str(data_key="CountryCode", required=True, validate=validate.Length(equal=2))
 
     @validates("country_code")
@@ -80,15 +117,18 @@ class CarrierSchema(Schema):
     max_item_height = fields.Int(data_key='MaxItemHeight')
     item_type = fields.Str(data_key='ItemType')
     delivery_group = fields.Str(data_key='DeliveryGroup')
-    collection_date = fields.DateTime(data_key='CollectionDate', format="%d/%m/%Y")
-    estimated_delivery_date = fields.DateTime(data_key='EstimatedDeliveryDate', format="%d/%m/%Y")
-    latest_booking_date_time = fields.DateTime(data_key='LatestBookingDateTime', format="%d/%m/%Y %H:%M")
+    collection_date = DateTimeField(data_key='CollectionDate', format="%d/%m/%Y")
+    estimated_delivery_date = DateTimeField(data_key='EstimatedDeliveryDate', format="%d/%m/%Y")
+    latest_booking_date_time = DateTimeField(data_key='LatestBookingDateTime', format="%d/%m/%Y %H:%M")
     rule_match = fields.DateTime(data_key='@RuleMatch', dump_only=True)
     rule_match_name = fields.DateTime(data_key='@RuleMatchName', dump_only=True)
 
     @post_load
     def remove_missing_fields(self, data, **kwargs):
-        return {key: value for key, value in data.items() if value is not None}
+        # data is the fresh dict built by this load, so it's trimmed in place rather than copied
+        for key in [key for key, value in data.items() if value is None]:
+            del data[key]
+        return data
 
 
 class ContactSchema(Schema):
@@ -106,20 +146,7 @@ class ExtendedItemSchemaSchema(ItemSchema):  # Inherits from your existing Goods
     tracking_number = fields.Str(data_key="TrackingNumber", load_only=True)
 
 class ExtendedItemsSchema(ItemsSchema):
-    item = fields.List(fields.Nested(ExtendedItemSchemaSchema), data_key="Item", required=True)
-
-    @pre_load
-    def ensure_item_is_list(self, data, **kwargs):
-        item = data.get("Item")
-        if item is not None and not isinstance(item, list):
-            data["Item"] = [item]
-        return data
-
-    @post_dump
-    def handle_single_item(self, data, **kwargs):
-        if len(data['Item']) == 1:
-            data['Item'] = data['Item'][0]
-        return data
+    item = ItemListField(ExtendedItemSchemaSchema, data_key="Item", required=True)
 
 class ExtendedShipmentDetailsSchema(ShipmentDetailsSchema):
     number_of_pieces = fields.Int(data_key="NumberOfPieces", required=True)
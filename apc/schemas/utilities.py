@@ -1,10 +1,67 @@
-import re
+from datetime import datetime
+from functools import lru_cache
 
+_UPPER = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_LOWER = frozenset("abcdefghijklmnopqrstuvwxyz")
+_LOWER_OR_DIGIT = _LOWER | frozenset("0123456789")
+
+
+@lru_cache(maxsize=1024)
 def camel_to_snake(name):
-    # Insert an underscore before each uppercase letter followed by a lowercase letter
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    # Insert an underscore before each uppercase letter that follows a lowercase letter or number
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    chars = []
+    last = len(name) - 1
+    for index, char in enumerate(name):
+        # Insert an underscore before each uppercase letter that follows a lowercase letter or number,
+        # or that starts a word (is followed by a lowercase letter)
+        if index and char in _UPPER and (
+            name[index - 1] in _LOWER_OR_DIGIT
+            or (index < last and name[index + 1] in _LOWER)
+        ):
+            chars.append("_")
+        chars.append(char)
+    return "".join(chars).lower()
+
+
+# The lengths of the API's date time formats that `parse_datetime` reads by slicing
+_SLICED_FORMATS = {"%d/%m/%Y": 10, "%d/%m/%Y %H:%M": 16}
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value, data_format):
+    """
+    Parse a date time string, as `datetime.strptime(value, data_format)`.
+
+    Values in the API's fixed "%d/%m/%Y" and "%d/%m/%Y %H:%M" formats are read by slicing, which skips
+    strptime's format parsing. Anything else is left to strptime. The API sends the same few dates on every
+    carrier, so the results are cached.
+
+    Args:
+        value (str): The date time string.
+        data_format (str): The strptime format of the value.
+
+    Returns:
+        datetime: The parsed date time.
+
+    Raises:
+        ValueError: If the value doesn't match the format.
+    """
+    size = _SLICED_FORMATS.get(data_format)
+    if (
+        size is not None
+        and len(value) == size
+        and value[2] == "/"
+        and value[5] == "/"
+        and (size == 10 or (value[10] == " " and value[13] == ":"))
+    ):
+        digits = value[0:2] + value[3:5] + value[6:10] + value[11:13] + value[14:16]
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(
+                    int(value[6:10]), int(value[3:5]), int(value[0:2]), int(value[11:13] or 0), int(value[14:16] or 0)
+                )
+            except ValueError:
+                pass
+    return datetime.strptime(value, data_format)
 
 
 def nested_lookup(d, keys):
@@ -12,14 +69,14 @@ def nested_lookup(d, keys):
     Lookup a key in a nested dictionary.
     Args:
         d (dict): Dictionary to lookup.
-        keys (list): List of keys to lookup.
+        keys (Sequence): Sequence of keys to lookup, a tuple avoids building a list per call.
 
     Returns:
         The value of the key if found, None otherwise.
     """
-    for key in keys:
-        if isinstance(d, dict) and key in d:
+    try:
+        for key in keys:
             d = d[key]
-        else:
-            return None
+    except (KeyError, IndexError, TypeError):
+        return None
     return d
@@ -1,21 +1,33 @@
-from typing import Optional
+from functools import lru_cache
+from typing import FrozenSet, Optional
 
-import pycountry
-def validate_country_code(country_code: Optional[str] = None):
+
+@lru_cache(maxsize=None)
+def _codes() -> FrozenSet[str]:
+    """
+    Get the ISO 3166-1 alpha-2 codes, built once so checking a code is a single set lookup.
+
+    pycountry loads its database when imported, so it's only imported the first time a code is checked.
+
+    Returns:
+        FrozenSet[str]: The valid country codes.
+    """
+    import pycountry
+
+    return frozenset(country.alpha_2 for country in pycountry.countries)
+
+
+def validate_country_code(country_code: Optional[str] = None) -> bool:
     """
     Validates the country code.
     Args:
-        country_code (str): Country code to validate.
+        country_code (str): Country code to validate, case-insensitive.
 
     Returns:
         bool: True if the country code is valid, False otherwise.
 
-    Raises:
-        KeyError: If the country code is invalid.
-
     """
-    try:
-        pycountry.countries.get(alpha_2=country_code)
-    except KeyError:
+    if not isinstance(country_code, str):
         return False
-    return True
+    codes = _codes()
+    return country_code in codes or country_code.upper() in codes
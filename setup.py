@@ -16,6 +16,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=read_requirements(),
+    extras_require={'speedups': ['orjson', 'msgspec'], 'async': ['httpx']},
     url='https://github.com/lewis-morris/APyC',
     license='MIT',
     author='lewis',
@@ -0,0 +1,363 @@
+import json
+from datetime import date, time
+
+import pytest
+
+from apc.client import client
+from apc.client.client import _BaseApi, _Order, _Service
+from apc.schemas.dataclasses import Address, Item, ItemType
+from apc.schemas.exceptions import ApiFieldException
+from apc.schemas.schemas import OrderOutputApiResponseSchema
+
+SERVICES = [
+    {"Carrier": "DPD", "ProductCode": "ND16"},
+    {"Carrier": "Parcelforce", "ProductCode": "PF48"},
+]
+
+SERVICE_AVAILABILITY = json.dumps(
+    {
+        "ServiceAvailability": {
+            "Messages": {"Code": "SUCCESS", "Description": "SUCCESS"},
+            "AccountNumber": ["123"],
+            "Services": {"Service": SERVICES},
+        }
+    }
+).encode()
+
+ORDER_ERROR = json.dumps(
+    {
+        "Orders": {
+            "Messages": {"Code": "ERROR"},
+            "Order": {
+                "Messages": {
+                    "Description": "Validation failed",
+                    "ErrorFields": {"ErrorField": {"FieldName": "PostalCode", "ErrorMessage": "Invalid"}},
+                }
+            },
+        }
+    }
+).encode()
+
+
+@pytest.fixture(params=["msgspec", "json", "ujson"])
+def api(request, monkeypatch):
+    if request.param == "msgspec":
+        if client.msgspec is None:
+            pytest.skip("msgspec is not installed")
+    else:
+        monkeypatch.setattr(client, "msgspec", None)
+    if request.param == "ujson":
+        monkeypatch.setattr(client, "_loads", pytest.importorskip("ujson").loads)
+    return _BaseApi("user", "password")
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+
+    def make(respond):
+        api = _BaseApi("user", "password")
+        api.requests = []
+
+        def handler(request):
+            api.requests.append(request)
+            return respond(request)
+
+        monkeypatch.setattr(
+            api,
+            "async_session",
+            lambda: httpx.AsyncClient(
+                base_url=api.base_url, headers=api._headers, transport=httpx.MockTransport(handler)
+            ),
+        )
+        return api
+
+    return make
+
+
+class TestDecodeResponse:
+    #  The data found at the output base is returned
+    def test_decode_output_base(self, api):
+        result = api._decode_response(SERVICE_AVAILABILITY, ("ServiceAvailability", "Services", "Service"))
+        assert result == SERVICES
+
+    #  The whole response is returned without an output base
+    def test_decode_without_output_base(self, api):
+        result = api._decode_response(SERVICE_AVAILABILITY)
+        assert result == json.loads(SERVICE_AVAILABILITY)
+
+    #  Error responses raise with the field errors
+    def test_decode_error_response(self, api):
+        with pytest.raises(ApiFieldException, match="Validation failed : FIELD postal_code - Invalid"):
+            api._decode_response(ORDER_ERROR, ("Orders", "Order"))
+
+    #  Error responses with unexpected details still raise the API error
+    @pytest.mark.parametrize(
+        "order",
+        [
+            [{"Messages": {"Description": "Validation failed"}}],
+            {"Messages": {"Description": "Validation failed", "ErrorFields": ["PostalCode"]}},
+            {"Messages": {"Description": "Validation failed", "ErrorFields": {"ErrorField": "PostalCode"}}},
+            {"Messages": "Validation failed"},
+        ],
+    )
+    def test_decode_malformed_error_response(self, api, order):
+        content = json.dumps({"Orders": {"Messages": {"Code": "ERROR"}, "Order": order}}).encode()
+        with pytest.raises(ApiFieldException, match="API returned error"):
+            api._decode_response(content, ("Orders", "Order"))
+
+    #  Empty and non-object responses raise the API error
+    @pytest.mark.parametrize("content", [b"{}", b"[]", b"[1]", b"null", b'"x"'])
+    def test_decode_unexpected_response(self, api, content):
+        with pytest.raises(ApiFieldException, match="unexpected response"):
+            api._decode_response(content, ("Orders", "Order"))
+
+    #  A response missing the output base raises
+    def test_decode_missing_output_base(self, api):
+        with pytest.raises(ApiFieldException, match="missing"):
+            api._decode_response(SERVICE_AVAILABILITY, ("ServiceAvailability", "Carriers"))
+
+    #  Invalid JSON is reported as a connection error
+    def test_decode_invalid_json(self, api):
+        with pytest.raises(ConnectionError):
+            api._decode_response(b"<html>", ("ServiceAvailability", "Services", "Service"))
+
+
+class TestBaseApi:
+    #  The credentials are encoded once into the session headers
+    def test_session_headers(self):
+        api = _BaseApi("user", "password")
+        assert api._session.headers["remote-user"] == "Basic dXNlcjpwYXNzd29yZA=="
+        assert api._session.headers["Content-Type"] == "application/json"
+        assert api._headers["remote-user"] == api._session.headers["remote-user"]
+
+    #  Leaving the context closes the session
+    def test_context_manager_closes_session(self, monkeypatch):
+        closed = []
+        with _BaseApi("user", "password") as api:
+            monkeypatch.setattr(api._session, "close", lambda: closed.append(True))
+        assert closed == [True]
+
+
+class TestLoadResponse:
+    #  Responses are loaded with one shared schema instance
+    def test_schema_instance_is_shared(self, monkeypatch):
+        monkeypatch.setattr(client, "_SCHEMA_CACHE", {})
+        api = _BaseApi("user", "password")
+        for number in range(3):
+            result = api._load_response({"OrderNumber": f"N{number}"}, OrderOutputApiResponseSchema)
+            assert result == {"order_number": f"N{number}"}
+        schema = client._SCHEMA_CACHE[OrderOutputApiResponseSchema]
+        assert client._schema(OrderOutputApiResponseSchema) is schema
+
+
+class TestService:
+    company = Address(
+        company_name="Company",
+        address_line1="1 Test Road",
+        city="City",
+        postal_code="EN1 1LR",
+        open_from=time(9, 0),
+        open_to=time(17, 0),
+    )
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        api = _BaseApi("user", "password")
+        calls = []
+
+        def make_request(**kwargs):
+            calls.append(kwargs)
+            return [{"carrier": "DPD", "service_code": "ND16"}]
+
+        monkeypatch.setattr(api, "make_request", make_request)
+        service = _Service(api, self.company)
+        service.calls = calls
+        return service
+
+    #  Identical lookups are only sent to the API once
+    def test_repeated_lookups_are_cached(self, service):
+        first = service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        second = service.get_shipping_services("PO16 7GZ", [Item(weight=1)], collection_date=date(2024, 3, 4))
+        assert len(service.calls) == 1
+        assert first.records == second.records
+        assert first.records is not second.records
+
+    #  Lookups for different items are sent to the API
+    def test_different_lookups_are_not_cached(self, service):
+        service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        service.get_shipping_services("PO16 7GZ", Item(weight=2), collection_date=date(2024, 3, 4))
+        assert len(service.calls) == 2
+        assert service.calls[1]["body"]["Orders"]["Order"]["ShipmentDetails"]["Items"]["Item"]["Weight"] == 2.0
+
+    #  Clearing the cache fetches the services again
+    def test_clear_cache(self, service):
+        service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        service.clear_cache()
+        service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        assert len(service.calls) == 2
+
+    #  Changing the returned services doesn't change the cached ones
+    def test_cached_records_are_copied(self, service):
+        first = service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        first.records[0]["carrier"] = "Changed"
+        second = service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        assert second.records == [{"carrier": "DPD", "service_code": "ND16"}]
+
+    #  Cached services are fetched again once the cache period has passed
+    def test_cache_expires(self, service, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(client, "monotonic", lambda: now[0])
+        service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        now[0] += service.cache_ttl
+        service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        assert len(service.calls) == 2
+
+    #  A single service, sent by the API without a list, is returned as one record
+    def test_single_service(self, service, monkeypatch):
+        monkeypatch.setattr(service._api, "make_request", lambda **kwargs: {"carrier": "DPD", "service_code": "ND16"})
+        services = service.get_shipping_services("PO16 7GZ", Item(weight=1), collection_date=date(2024, 3, 4))
+        assert services.records == [{"carrier": "DPD", "service_code": "ND16"}]
+
+    #  Items weighing more than the limit, or NaN, are rejected before calling the API
+    @pytest.mark.parametrize("weights", [[1, 101], [1, float("nan")], [float("nan")], [float("nan"), 1]])
+    def test_item_weight_out_of_range(self, service, weights):
+        with pytest.raises(ValueError, match="weights"):
+            service.get_shipping_services("PO16 7GZ", [Item(weight=weight) for weight in weights])
+        assert service.calls == []
+
+    #  The hand built request body matches the schema's
+    @pytest.mark.parametrize(
+        "items, order_value",
+        [
+            ([Item(weight=1)], None),
+            ([Item(weight=2, type=ItemType.PACK, length=1, width=2, height=3, value=4), Item(weight=3)], 25),
+        ],
+    )
+    def test_service_payload_matches_schema(self, items, order_value, monkeypatch):
+        service = _Service(_BaseApi("user", "password"), self.company)
+        query = service._service_query(
+            "PO16 7GZ", items, order_value=order_value, is_fragile=True, collection_date=date(2024, 3, 4)
+        )
+        payload = service._service_payload(*query)
+        monkeypatch.setattr(service, "debug", True)
+        assert payload == service._service_payload(*query)
+        assert payload["Orders"]["Order"]["ShipmentDetails"]["NumberOfPieces"] == len(items)
+
+    #  Batched lookups are sent concurrently, once per distinct query, and returned in order
+    def test_get_shipping_services_batch(self, mock_api):
+        httpx = pytest.importorskip("httpx")
+
+        def respond(request):
+            postal_code = json.loads(request.content)["Orders"]["Order"]["Delivery"]["PostalCode"]
+            return httpx.Response(
+                200,
+                json={
+                    "ServiceAvailability": {
+                        "Messages": {"Code": "SUCCESS"},
+                        "Services": {"Service": [{"Carrier": postal_code, "ProductCode": "ND16"}]},
+                    }
+                },
+            )
+
+        api = mock_api(respond)
+        service = _Service(api, self.company)
+        queries = [
+            {"delivery_postal_code": postal_code, "items": Item(weight=1), "collection_date": date(2024, 3, 4)}
+            for postal_code in ["PO16 7GZ", "EN1 1LR", "PO16 7GZ"]
+        ]
+        results = service.get_shipping_services_batch(queries)
+
+        assert [result.records for result in results] == [
+            [{"carrier": "PO16 7GZ", "service_code": "ND16"}],
+            [{"carrier": "EN1 1LR", "service_code": "ND16"}],
+            [{"carrier": "PO16 7GZ", "service_code": "ND16"}],
+        ]
+        assert results[0].records is not results[2].records
+        assert len(api.requests) == 2
+        assert str(api.requests[0].url) == "https://apc.hypaship.com/api/3.0/ServiceAvailability.json"
+
+
+class TestOrder:
+    company = TestService.company
+    customer = Address("Customer", "2 Test Lane", "Town", "PO16 7GZ", mobile_number="07000000000")
+
+    #  Batched deliveries are all sent and returned in the order they were given
+    def test_make_deliveries(self, mock_api):
+        httpx = pytest.importorskip("httpx")
+
+        def respond(request):
+            reference = json.loads(request.content)["Orders"]["Order"]["Reference"]
+            return httpx.Response(
+                200,
+                json={
+                    "Orders": {
+                        "Messages": {"Code": "SUCCESS"},
+                        "Order": {"OrderNumber": f"N-{reference}", "Reference": reference},
+                    }
+                },
+            )
+
+        api = mock_api(respond)
+        order = _Order(api, self.company)
+        deliveries = [
+            {
+                "service_code": "ND16",
+                "delivery_address": self.customer,
+                "items": Item(weight=1),
+                "ship_reference": f"INV{number}",
+            }
+            for number in range(5)
+        ]
+        responses = order.make_deliveries(deliveries)
+
+        assert [response["order_number"] for response in responses] == [f"N-INV{number}" for number in range(5)]
+        assert len(api.requests) == 5
+        assert str(api.requests[0].url) == "https://apc.hypaship.com/api/3.0/Orders.json"
+        assert api.requests[0].headers["remote-user"] == api._headers["remote-user"]
+
+    #  A failed delivery is returned in its place without losing the bookings that succeeded
+    def test_make_deliveries_partial_failure(self, mock_api):
+        httpx = pytest.importorskip("httpx")
+
+        def respond(request):
+            reference = json.loads(request.content)["Orders"]["Order"]["Reference"]
+            if reference == "INV1":
+                return httpx.Response(500)
+            return httpx.Response(
+                200,
+                json={
+                    "Orders": {
+                        "Messages": {"Code": "SUCCESS"},
+                        "Order": {"OrderNumber": f"N-{reference}", "Reference": reference},
+                    }
+                },
+            )
+
+        api = mock_api(respond)
+        order = _Order(api, self.company)
+        deliveries = [
+            {
+                "service_code": "ND16",
+                "delivery_address": self.customer,
+                "items": Item(weight=1),
+                "ship_reference": f"INV{number}",
+            }
+            for number in range(4)
+        ]
+        responses = order.make_deliveries(deliveries)
+
+        assert len(api.requests) == 4
+        assert isinstance(responses[1], ConnectionError)
+        assert [responses[number]["order_number"] for number in (0, 2, 3)] == ["N-INV0", "N-INV2", "N-INV3"]
+
+    #  An empty response body is returned as the API error, not a stopped coroutine
+    def test_make_deliveries_empty_response(self, mock_api):
+        httpx = pytest.importorskip("httpx")
+        api = mock_api(lambda request: httpx.Response(200, content=b"{}"))
+        order = _Order(api, self.company)
+        delivery = {"service_code": "ND16", "delivery_address": self.customer, "items": Item(weight=1)}
+        responses = order.make_deliveries([delivery])
+
+        assert len(responses) == 1
+        assert isinstance(responses[0], ApiFieldException)
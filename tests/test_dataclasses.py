@@ -166,6 +166,17 @@ class TestAddress:
         )
         assert add.country_code == "GB"
 
+    #  Create an Address object with an invalid country code.
+    def test_create_address_with_invalid_country_code(self):
+        with pytest.raises(ValueError):
+            Address(
+                company_name="Company",
+                address_line1="123 Main St",
+                postal_code="12345",
+                city="City",
+                country_code="XX",
+            )
+
     #  Create an Address object with an empty address_line1.
     def test_create_address_with_empty_address_line1(self):
         with pytest.raises(ValueError):
@@ -0,0 +1,102 @@
+from collections import defaultdict
+from datetime import date, time
+
+from marshmallow import Schema, fields
+from marshmallow.decorators import POST_DUMP
+
+from apc.schemas.dataclasses import Address, Item, ItemType
+from apc.schemas.fast_dump import compile_dumper, dump_order, get_dumper
+from apc.schemas.schemas import ExtendedFullOrderSchema, ExtendedItemsSchema, ItemSchema, ServiceCheckSchema
+
+
+def make_order(items, collection, delivery):
+    return {
+        "orders": {
+            "order": {
+                "service_code": "ND16",
+                "ship_reference": "INV1",
+                "collection_date": date(2024, 3, 4),
+                "ready_at": time(9, 0),
+                "closed_at": time(17, 30),
+                "collection": collection,
+                "delivery": delivery,
+                "goods_info": {"goods_description": "Widgets", "fragile": True, "increased_liability": False},
+                "shipment_details": {
+                    "number_of_pieces": len(items),
+                    "items": {"item": [item.to_dict() for item in items]},
+                },
+            }
+        }
+    }
+
+
+class TestFastDump:
+    company = Address(
+        company_name="Company",
+        address_line1="1 Test Road",
+        city="City",
+        postal_code="EN1 1LR",
+        person_name="John Doe",
+        email="john@example.com",
+    )
+    customer = Address("Customer", "2 Test Lane", "Town", "PO16 7GZ", mobile_number="07000000000")
+
+    #  A single item order dumps the same as the marshmallow schema, including the single item collapse.
+    def test_single_item_order_matches_schema(self):
+        data = make_order([Item(weight=1)], self.company.to_dict(), self.customer.to_dict())
+        assert dump_order(data) == ExtendedFullOrderSchema().dump(data)
+
+    #  A multi item order dumps the same as the marshmallow schema.
+    def test_multiple_item_order_matches_schema(self):
+        items = [Item(weight=2, type=ItemType.PACK, length=1, width=2, height=3, value=4), Item(weight=3)]
+        data = make_order(items, self.company.to_dict(), self.customer.to_dict())
+        assert dump_order(data) == ExtendedFullOrderSchema().dump(data)
+
+    #  Non dict values are handed back to marshmallow.
+    def test_dataclass_address_matches_schema(self):
+        data = make_order([Item(weight=1)], self.customer, self.customer.to_dict())
+        assert dump_order(data) == ExtendedFullOrderSchema().dump(data)
+
+    #  Dumpers can be compiled for other schemas.
+    def test_compile_service_check_dumper(self):
+        data = {
+            "orders": {
+                "order": {
+                    "collection_date": date(2024, 3, 4),
+                    "ready_at": time(9, 0),
+                    "closed_at": time(17, 30),
+                    "collection": {"postal_code": "EN1 1LR", "country_code": "GB"},
+                    "delivery": {"postal_code": "PO16 7GZ", "country_code": "GB"},
+                    "goods_info": {"goods_value": 10, "fragile": False},
+                    "shipment_details": {"number_of_pieces": 1, "items": {"item": [Item(weight=1).to_dict()]}},
+                }
+            }
+        }
+        assert compile_dumper(ServiceCheckSchema)(data) == ServiceCheckSchema().dump(data)
+
+    #  Dumpers are compiled once per schema class and kept on the class.
+    def test_get_dumper_is_cached_per_class(self):
+        class HeavyItemSchema(ItemSchema):
+            pass
+
+        assert get_dumper(ExtendedFullOrderSchema) is dump_order
+        assert ExtendedFullOrderSchema._fast_dump is dump_order
+        dumper = get_dumper(ItemSchema)
+        assert get_dumper(ItemSchema) is dumper
+        assert get_dumper(HeavyItemSchema) is not dumper
+        assert get_dumper(HeavyItemSchema)({"weight": 1}) == {"Type": "ALL", "Weight": 1.0}
+
+    #  The order dumper is generated rather than delegated to marshmallow.
+    def test_order_dumper_is_generated(self):
+        assert getattr(dump_order, "__func__", None) is not Schema.dump
+
+    #  Hooks registered in a shape the generator doesn't expect are left to marshmallow.
+    def test_unexpected_hooks_fall_back(self, monkeypatch):
+        hooks = defaultdict(list, {(POST_DUMP, False): ["handle_single_item"]})
+        monkeypatch.setattr(ExtendedItemsSchema, "_hooks", hooks)
+        assert compile_dumper(ExtendedItemsSchema).__func__ is Schema.dump
+
+    #  Fields without the expected attributes are left to marshmallow.
+    def test_unexpected_fields_fall_back(self, monkeypatch):
+        monkeypatch.delattr(fields.Field, "_CHECK_ATTRIBUTE")
+        assert compile_dumper(ItemSchema).__func__ is Schema.dump
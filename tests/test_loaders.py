@@ -0,0 +1,65 @@
+import pytest
+
+from apc.client.client import _BaseApi
+from apc.schemas import loaders
+from apc.schemas.schemas import CarrierSchema
+
+CARRIERS = [
+    {
+        "Carrier": "DPD",
+        "ServiceName": "Next Day",
+        "ProductCode": "ND16",
+        "MinTransitDays": "1",
+        "MaxTransitDays": 2,
+        "Tracked": "true",
+        "Signed": False,
+        "MaxCompensation": "100.50",
+        "MaxItemLength": "120",
+        "ItemType": "PARCEL",
+        "DeliveryGroup": "Standard",
+        "CollectionDate": "04/03/2024",
+        "EstimatedDeliveryDate": "05/03/2024",
+        "LatestBookingDateTime": "04/03/2024 16:30",
+        "Rate": "9.99",
+    },
+    {"Carrier": "Parcelforce", "ProductCode": "PF48"},
+]
+
+
+class TestLoaders:
+    #  A registered loader replaces the schema load
+    def test_registered_loader_is_used(self, monkeypatch):
+        monkeypatch.setitem(loaders.LOADERS, CarrierSchema, lambda records: [{"carrier": "Loaded"}])
+        api = _BaseApi("user", "password")
+        assert api._load_response([{"Carrier": "DPD"}], CarrierSchema) == [{"carrier": "Loaded"}]
+
+    #  Records a loader declines are loaded by the schema
+    def test_declined_records_use_schema(self, monkeypatch):
+        monkeypatch.setitem(loaders.LOADERS, CarrierSchema, lambda records: None)
+        api = _BaseApi("user", "password")
+        assert api._load_response([{"Carrier": "DPD"}], CarrierSchema) == [{"carrier": "DPD"}]
+
+
+class TestMapCarriers:
+    #  Carrier records load the same as the marshmallow schema.
+    def test_matches_schema(self):
+        assert loaders.map_carriers(CARRIERS) == CarrierSchema().load(CARRIERS, many=True)
+
+    #  Values the schema would reject are left to the schema.
+    @pytest.mark.parametrize(
+        "record",
+        [
+            {"Tracked": "maybe"},
+            {"CollectionDate": "2024-03-04"},
+            {"MinTransitDays": "1.0"},
+            {"MaxCompensation": "nan"},
+            {"ServiceName": None},
+        ],
+    )
+    def test_invalid_value_falls_back(self, record):
+        assert loaders.map_carriers([{"Carrier": "DPD", **record}]) is None
+
+    #  The mapping is used to load carrier responses.
+    def test_registered_loader(self):
+        assert loaders.LOADERS[CarrierSchema] is loaders.map_carriers
+
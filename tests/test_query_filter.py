@@ -1,6 +1,9 @@
 # Generated by CodiumAI
+import pytest
+from marshmallow import Schema, fields
 
-from apc.schemas.models import Services
+from apc.schemas.models import Query, QueryableAttribute, Services
+from apc.schemas.schemas import CarrierSchema
 
 
 class TestServices:
@@ -31,13 +34,13 @@ class TestServices:
     def test_filter_records_by_single_condition(self):
         services = Services(
             [
-                {"name": "Service A", "status": "Active"},
-                {"name": "Service B", "status": "Inactive"},
+                {"service_name": "Service A", "item_type": "PARCEL"},
+                {"service_name": "Service B", "item_type": "PACK"},
             ]
         )
-        filtered_services = services.filter(services.status == "Active")
+        filtered_services = services.filter(services.item_type == "PARCEL")
         assert len(filtered_services.records) == 1
-        assert filtered_services.records[0]["name"] == "Service A"
+        assert filtered_services.records[0]["service_name"] == "Service A"
 
     #  Services object can be created with an empty list
     def test_create_services_with_empty_list(self):
@@ -47,16 +50,109 @@ class TestServices:
     #  Records can be filtered by a condition on an empty list of records
     def test_filter_records_on_empty_list(self):
         services = Services([])
-        filtered_services = services.filter(services.status == "Active")
+        filtered_services = services.filter(services.item_type == "PARCEL")
         assert len(filtered_services.records) == 0
 
     #  Records can be filtered by a condition on an attribute that does not exist in any record
-    def test_filter_records_on_nonexistent_attribute(self):
+    def test_filter_records_on_missing_attribute(self):
         services = Services(
             [
                 {"name": "Service A", "status": "Active"},
                 {"name": "Service B", "status": "Inactive"},
             ]
         )
-        filtered_services = services.filter(services.nonexistent_attribute == "Value")
+        filtered_services = services.filter(services.carrier == "DPD")
         assert len(filtered_services.records) == 0
+
+    #  Attributes that aren't fields of the schema can't be queried
+    def test_filter_records_on_nonexistent_attribute(self):
+        services = Services([])
+        with pytest.raises(AttributeError):
+            services.nonexistent_attribute
+
+    #  Records can be filtered by multiple conditions, all of which must match
+    def test_filter_records_by_multiple_conditions(self):
+        services = Services(
+            [
+                {"carrier": "DPD", "tracked": True, "max_transit_days": 1},
+                {"carrier": "DPD", "tracked": False, "max_transit_days": 1},
+                {"carrier": "Royal Mail", "tracked": True, "max_transit_days": 3},
+                {"carrier": "dpd", "tracked": True, "max_transit_days": 4},
+            ]
+        )
+        filtered_services = services.filter(
+            services.carrier == "DPD", services.tracked == True, services.max_transit_days <= 3
+        )
+        assert filtered_services.records == [{"carrier": "DPD", "tracked": True, "max_transit_days": 1}]
+
+    #  Equality filters on the same services reuse the field index
+    def test_filter_records_by_indexed_equality(self):
+        services = Services(
+            [
+                {"carrier": "DPD", "item_type": "PARCEL"},
+                {"carrier": "Royal Mail", "item_type": "PARCEL"},
+                {"carrier": "DPD", "item_type": "PACK"},
+            ]
+        )
+        assert services.filter(services.carrier == "dpd").records == [
+            {"carrier": "DPD", "item_type": "PARCEL"},
+            {"carrier": "DPD", "item_type": "PACK"},
+        ]
+        assert services.filter_eq("item_type", "parcel").records == [
+            {"carrier": "DPD", "item_type": "PARCEL"},
+            {"carrier": "Royal Mail", "item_type": "PARCEL"},
+        ]
+        assert services.filter(services.carrier == "DPD", services.item_type == "PACK").records == [
+            {"carrier": "DPD", "item_type": "PACK"},
+        ]
+
+    #  Changes to the records after filtering are seen by later filters
+    def test_filter_after_changing_records(self):
+        services = Services([{"carrier": "DPD"}, {"carrier": "UPS"}])
+        assert services.filter(services.carrier == "ups").records == [{"carrier": "UPS"}]
+        services.records[1]["carrier"] = "DPD"
+        assert services.filter(services.carrier == "ups").records == []
+        assert services.filter(services.carrier == "dpd").records == [{"carrier": "DPD"}, {"carrier": "DPD"}]
+        services.records.append({"carrier": "UPS"})
+        assert services.filter_eq("carrier", "UPS").records == [{"carrier": "UPS"}]
+
+    #  Conditions can be mixed with plain callables taking the record
+    def test_filter_records_by_conditions_and_callables(self):
+        services = Services(
+            [
+                {"carrier": "DPD", "service_name": "Next Day", "signed": None},
+                {"carrier": "Parcelforce", "service_name": "Express 48", "signed": True},
+            ]
+        )
+        filtered_services = services.filter(
+            services.service_name.like("express"),
+            services.signed.is_not_null(),
+            lambda record: record["carrier"].startswith("Parcel"),
+        )
+        assert filtered_services.records == [
+            {"carrier": "Parcelforce", "service_name": "Express 48", "signed": True}
+        ]
+
+
+class TestQuery:
+    #  A plain Query only gets the queryable attributes of its own schema
+    def test_queryable_attributes_per_schema(self):
+        class NoteSchema(Schema):
+            note = fields.Str()
+
+        carriers = Query([{"carrier": "DPD"}], CarrierSchema)
+        notes = Query([{"note": "Fragile"}], NoteSchema)
+        assert isinstance(carriers.carrier, QueryableAttribute)
+        assert isinstance(notes.note, QueryableAttribute)
+        assert not hasattr(carriers, "note")
+        assert not hasattr(notes, "carrier")
+        assert not hasattr(Query, "carrier")
+        assert type(Query([], CarrierSchema)) is type(carriers)
+
+    #  Filtering a plain Query keeps its schema
+    def test_filter_plain_query(self):
+        query = Query([{"carrier": "DPD"}, {"carrier": "UPS"}], CarrierSchema)
+        filtered = query.filter(query.carrier == "ups")
+        assert filtered.records == [{"carrier": "UPS"}]
+        assert isinstance(filtered, Query)
+        assert filtered.filter(filtered.carrier != "ups").records == []
@@ -0,0 +1,50 @@
+import pytest
+from marshmallow import ValidationError
+
+from apc.schemas.schemas import AddressSchema, ExtendedItemsSchema
+
+
+class TestAddressSchema:
+    #  Valid postal codes load.
+    @pytest.mark.parametrize("postal_code", ["EN1 1LR", "PO167GZ", "BFPO 123", "GIR 0AA"])
+    def test_valid_postal_code(self, postal_code):
+        data = AddressSchema().load({"PostalCode": postal_code, "CountryCode": "GB"})
+        assert data["postal_code"] == postal_code
+
+    #  Invalid postal codes are rejected with the postal code error.
+    @pytest.mark.parametrize("postal_code", ["", "EN1 1L", "en1 1lr", "EN1 1LR "])
+    def test_invalid_postal_code(self, postal_code):
+        with pytest.raises(ValidationError) as error:
+            AddressSchema().load({"PostalCode": postal_code, "CountryCode": "GB"})
+        assert error.value.messages == {"PostalCode": ["Invalid Postal Code format."]}
+
+
+class TestExtendedItemsSchema:
+    #  A single item is loaded as a list of one item.
+    def test_load_single_item(self):
+        data = ExtendedItemsSchema().load({"Item": {"Weight": 1, "ItemNumber": 1}})
+        assert data == {"item": [{"weight": 1.0, "item_number": 1}]}
+
+    #  A list of items is loaded as is.
+    def test_load_item_list(self):
+        data = ExtendedItemsSchema().load({"Item": [{"Weight": 1}, {"Weight": 2}]})
+        assert data == {"item": [{"weight": 1.0}, {"weight": 2.0}]}
+
+    #  A missing item is still required.
+    def test_load_missing_item(self):
+        with pytest.raises(ValidationError) as error:
+            ExtendedItemsSchema().load({})
+        assert error.value.messages == {"Item": ["Missing data for required field."]}
+
+    #  Invalid items are reported by position.
+    def test_load_invalid_single_item(self):
+        with pytest.raises(ValidationError) as error:
+            ExtendedItemsSchema().load({"Item": {"Weight": "heavy"}})
+        assert error.value.messages == {"Item": {0: {"Weight": ["Not a valid number."]}}}
+
+    #  A single dumped item is sent without the list, several items as a list.
+    def test_dump_items(self):
+        schema = ExtendedItemsSchema()
+        assert schema.dump({"item": [{"weight": 1}]}) == {"Item": {"Type": "ALL", "Weight": 1.0}}
+        assert schema.dump({"item": [{"weight": 1}, {"weight": 2}]})["Item"][1] == {"Type": "ALL", "Weight": 2.0}
+        assert schema.dump({}) == {}
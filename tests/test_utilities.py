@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+
+from apc.schemas.utilities import camel_to_snake, nested_lookup, parse_datetime
+
+
+class TestCamelToSnake:
+    #  Camel case names are converted to snake case.
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("PostalCode", "postal_code"),
+            ("LatestBookingDateTime", "latest_booking_date_time"),
+            ("HTTPResponse", "http_response"),
+            ("AddressLine1", "address_line1"),
+            ("Item2Name", "item2_name"),
+            ("already_snake", "already_snake"),
+            ("", ""),
+        ],
+    )
+    def test_camel_to_snake(self, name, expected):
+        assert camel_to_snake(name) == expected
+
+
+class TestNestedLookup:
+    data = {"ServiceAvailability": {"Services": {"Service": [{"Carrier": "DPD"}]}, "AccountNumber": "123"}}
+
+    #  The value at the end of the path is returned.
+    def test_found(self):
+        assert nested_lookup(self.data, ("ServiceAvailability", "Services", "Service")) == [{"Carrier": "DPD"}]
+        assert nested_lookup(self.data, ()) is self.data
+
+    #  Paths that can't be followed return None.
+    @pytest.mark.parametrize(
+        "keys",
+        [("Orders",), ("ServiceAvailability", "Carriers"), ("ServiceAvailability", "AccountNumber", "Number")],
+    )
+    def test_not_found(self, keys):
+        assert nested_lookup(self.data, keys) is None
+
+
+class TestParseDatetime:
+    #  Dates are parsed the same as strptime.
+    @pytest.mark.parametrize(
+        "value, data_format",
+        [
+            ("04/03/2024", "%d/%m/%Y"),
+            ("4/3/2024", "%d/%m/%Y"),
+            ("29/02/2024", "%d/%m/%Y"),
+            ("04/03/2024 16:30", "%d/%m/%Y %H:%M"),
+            ("2024-03-04", "%Y-%m-%d"),
+        ],
+    )
+    def test_matches_strptime(self, value, data_format):
+        assert parse_datetime(value, data_format) == datetime.strptime(value, data_format)
+
+    #  Invalid dates raise as strptime does.
+    @pytest.mark.parametrize(
+        "value, data_format",
+        [
+            ("30/02/2024", "%d/%m/%Y"),
+            ("04/03/2024", "%d/%m/%Y %H:%M"),
+            ("04/03/2024 24:00", "%d/%m/%Y %H:%M"),
+            ("", "%d/%m/%Y"),
+        ],
+    )
+    def test_invalid(self, value, data_format):
+        with pytest.raises(ValueError):
+            parse_datetime(value, data_format)